@@ -2,14 +2,12 @@
 RunPod | CLI | Project | Functions
 """
 
+import functools
 import os
-import sys
+import time
 import uuid
 from datetime import datetime
 
-import tomlkit
-from tomlkit import comment, document, nl, table
-
 from runpod import (
     __version__,
     create_endpoint,
@@ -27,49 +25,71 @@ from .helpers import (
     get_project_endpoint,
     get_project_pod,
     load_project_config,
+    replace_placeholders,
 )
 
 STARTER_TEMPLATES = os.path.join(os.path.dirname(__file__), "starter_templates")
+SCRIPTS_DIR = os.path.join(os.path.dirname(__file__), "scripts")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_launch_api_server_script():
+    """Read the remote dev API server script template, once per process."""
+    script_path = os.path.join(SCRIPTS_DIR, "launch_api_server.sh")
+    with open(script_path, "r", encoding="UTF-8") as script_file:
+        return script_file.read()
 
 
-def _launch_dev_pod():
-    """Launch a development pod."""
+def _launch_dev_pod(timeout=600):
+    """Launch a development pod, waiting up to timeout seconds for it to come online."""
     config = load_project_config()  # Load runpod.toml
+    project_config = config["project"]
 
     print("Deploying development pod on RunPod...")
 
     # Prepare the environment variables
-    environment_variables = {"RUNPOD_PROJECT_ID": config["project"]["uuid"]}
-    for variable in config["project"].get("env_vars", {}):
-        environment_variables[variable] = config["project"]["env_vars"][variable]
+    environment_variables = {
+        "RUNPOD_PROJECT_ID": project_config["uuid"],
+        **project_config.get("env_vars", {}),
+    }
 
-    # Prepare the GPU types
-    selected_gpu_types = config["project"].get("gpu_types", [])
-    if config["project"].get("gpu", None):
-        selected_gpu_types.append(config["project"]["gpu"])
+    # Prepare the GPU types, copied since the loaded config is cached and shared
+    selected_gpu_types = list(project_config.get("gpu_types", []))
+    if project_config.get("gpu", None):
+        selected_gpu_types.append(project_config["gpu"])
 
     # Attempt to launch a pod with the given configuration
-    new_pod = attempt_pod_launch(config, environment_variables)
+    new_pod = attempt_pod_launch(config, environment_variables, selected_gpu_types)
     if new_pod is None:
         print(
             "Selected GPU types unavailable, try again later or use a different type."
         )
         return None
 
-    print("Waiting for pod to come online... ", end="")
-    sys.stdout.flush()
+    print("Waiting for pod to come online... ", end="", flush=True)
 
-    # Wait for the pod to come online
+    # Wait for the pod to come online, backing off between polls
+    start_time = time.monotonic()
+    poll_delay = 0.5
     while (
         new_pod.get("desiredStatus", None) != "RUNNING"
         or new_pod.get("runtime") is None
     ):
+        if time.monotonic() - start_time > timeout:
+            print(
+                f"Pod {new_pod['id']} did not come online within {timeout} seconds. "
+                "It may still be running, stop it from the RunPod console."
+            )
+            return None
+
+        time.sleep(poll_delay)
+        poll_delay = min(poll_delay * 1.5, 8.0)
         new_pod = get_pod(new_pod["id"])
 
     project_pod_id = new_pod["id"]
 
     print(
-        f"Project {config['project']['name']} pod ({project_pod_id}) created.",
+        f"Project {project_config['name']} pod ({project_pod_id}) created.",
         end="\n\n",
     )
     return project_pod_id
@@ -88,8 +108,7 @@ def create_new_project(
     """Create a new project."""
     if not init_current_dir:
         project_folder = os.path.join(os.getcwd(), project_name)
-        if not os.path.exists(project_folder):
-            os.makedirs(project_folder)
+        os.makedirs(project_folder, exist_ok=True)
 
         if model_type is None:
             model_type = "default"
@@ -98,70 +117,66 @@ def create_new_project(
 
         copy_template_files(template_dir, project_folder)
 
-        # Replace placeholders in requirements.txt
-        requirements_path = os.path.join(project_folder, "builder/requirements.txt")
-        with open(requirements_path, "r", encoding="utf-8") as requirements_file:
-            requirements_content = requirements_file.read()
-
+        # Replace placeholders in requirements.txt, and in handler.py if there's a model_name
         if "dev" in __version__:
-            requirements_content = requirements_content.replace(
-                "<<RUNPOD>>", "git+https://github.com/runpod/runpod-python.git"
-            )
+            runpod_requirement = "git+https://github.com/runpod/runpod-python.git"
         else:
-            requirements_content = requirements_content.replace(
-                "<<RUNPOD>>", f"runpod=={__version__}"
-            )
-
-        with open(requirements_path, "w", encoding="utf-8") as requirements_file:
-            requirements_file.write(requirements_content)
+            runpod_requirement = f"runpod=={__version__}"
 
-        # If there's a model_name, replace placeholders in handler.py
+        placeholder_files = [
+            (
+                os.path.join(project_folder, "builder/requirements.txt"),
+                {"<<RUNPOD>>": runpod_requirement},
+            )
+        ]
         if model_name:
-            handler_path = os.path.join(project_name, "src/handler.py")
-            with open(handler_path, "r", encoding="utf-8") as file:
-                handler_content = file.read()
-                handler_content = handler_content.replace("<<MODEL_NAME>>", model_name)
+            placeholder_files.append(
+                (
+                    os.path.join(project_folder, "src/handler.py"),
+                    {"<<MODEL_NAME>>": model_name},
+                )
+            )
 
-            with open(handler_path, "w", encoding="utf-8") as file:
-                file.write(handler_content)
+        for file_path, substitutions in placeholder_files:
+            replace_placeholders(file_path, substitutions)
     else:
         project_folder = os.getcwd()
 
     project_uuid = str(uuid.uuid4())[:8]
 
-    toml_config = document()
-    toml_config.add(comment("RunPod Project Configuration"))
-    toml_config.add(nl())
-    toml_config.add("title", project_name)
-
-    project_table = table()
-    project_table.add("uuid", project_uuid)
-    project_table.add("name", project_name)
-    project_table.add("base_image", BASE_DOCKER_IMAGE.format(cuda_version=cuda_version))
-    project_table.add("gpu_types", GPU_TYPES)
-    project_table.add("gpu_count", 1)
-    project_table.add("storage_id", runpod_volume_id)
-    project_table.add("volume_mount_path", "/runpod-volume")
-    project_table.add("ports", "8080/http, 22/tcp")
-    project_table.add("container_disk_size_gb", 10)
-    project_table.add("env_vars", ENV_VARS)
-    toml_config.add("project", project_table)
-
-    template_table = table()
-    template_table.add("model_type", str(model_type))
-    template_table.add("model_name", str(model_name))
-    toml_config.add("template", template_table)
-
-    runtime_table = table()
-    runtime_table.add("python_version", python_version)
-    runtime_table.add("handler_path", "src/handler.py")
-    runtime_table.add("requirements_path", "builder/requirements.txt")
-    toml_config.add("runtime", runtime_table)
+    toml_config = {
+        "title": project_name,
+        "project": {
+            "uuid": project_uuid,
+            "name": project_name,
+            "base_image": BASE_DOCKER_IMAGE.format(cuda_version=cuda_version),
+            "gpu_types": GPU_TYPES,
+            "gpu_count": 1,
+            "storage_id": runpod_volume_id,
+            "volume_mount_path": "/runpod-volume",
+            "ports": "8080/http, 22/tcp",
+            "container_disk_size_gb": 10,
+            "env_vars": ENV_VARS,
+        },
+        "template": {
+            "model_type": str(model_type),
+            "model_name": str(model_name),
+        },
+        "runtime": {
+            "python_version": python_version,
+            "handler_path": "src/handler.py",
+            "requirements_path": "builder/requirements.txt",
+        },
+    }
+
+    # Only needed when writing a new project, keep it off the CLI import path
+    import tomli_w  # pylint: disable=import-outside-toplevel
 
     with open(
         os.path.join(project_folder, "runpod.toml"), "w", encoding="UTF-8"
     ) as config_file:
-        tomlkit.dump(toml_config, config_file)
+        config_file.write("# RunPod Project Configuration\n\n")
+        config_file.write(tomli_w.dumps(toml_config))
 
 
 # ------------------------------- Start Project ------------------------------ #
@@ -182,15 +197,22 @@ def start_project():  # pylint: disable=too-many-locals, too-many-branches
 
     """
     config = load_project_config()  # Load runpod.toml
+    project_config = config["project"]
+    runtime_config = config["runtime"]
+    project_uuid = project_config["uuid"]
+    project_name = project_config["name"]
+    requirements_path = runtime_config["requirements_path"]
 
-    for config_item in config["project"]:
-        print(f'    - {config_item}: {config["project"][config_item]}')
-    print("")
+    print(
+        "\n".join(f"    - {key}: {value}" for key, value in project_config.items()),
+        end="\n\n",
+    )
 
-    project_pod_id = get_project_pod(config["project"]["uuid"])
+    project_pod_id = get_project_pod(project_uuid)
 
     # Check if the project pod already exists, if not create it.
-    if not project_pod_id:
+    new_pod = not project_pod_id
+    if new_pod:
         project_pod_id = _launch_dev_pod()
 
     if project_pod_id is None:
@@ -198,145 +220,50 @@ def start_project():  # pylint: disable=too-many-locals, too-many-branches
 
     with SSHConnection(project_pod_id) as ssh_conn:
 
-        project_path_uuid = (
-            f'{config["project"]["volume_mount_path"]}/{config["project"]["uuid"]}'
-        )
+        project_path_uuid = f'{project_config["volume_mount_path"]}/{project_uuid}'
         project_path_uuid_dev = os.path.join(project_path_uuid, "dev")
         project_path_uuid_prod = os.path.join(project_path_uuid, "prod")
-        remote_project_path = os.path.join(
-            project_path_uuid_dev, config["project"]["name"]
-        )
+        remote_project_path = os.path.join(project_path_uuid_dev, project_name)
 
-        # Create the project folder on the pod
-        print(
-            f"Checking pod project folder: {remote_project_path} on pod {project_pod_id}"
-        )
-        ssh_conn.run_commands(
-            [f"mkdir -p {remote_project_path} {project_path_uuid_prod}"]
-        )
-
-        # Copy local files to the pod project folder
+        # Copy local files to the pod project folder, bulk_upload creates the folder
         print(f"Syncing files to pod {project_pod_id}")
-        ssh_conn.rsync(os.getcwd(), project_path_uuid_dev)
+        if new_pod:
+            ssh_conn.bulk_upload(os.getcwd(), project_path_uuid_dev)
+        else:
+            ssh_conn.run_commands([f"mkdir -p {project_path_uuid_dev}"])
+            ssh_conn.rsync(os.getcwd(), project_path_uuid_dev)
 
-        # Create the virtual environment
+        # Create the project folders and virtual environment in a single session
         venv_path = os.path.join(project_path_uuid_dev, "venv")
         print(
             f"Activating Python virtual environment: {venv_path} on pod {project_pod_id}"
         )
-        commands = [
-            f'python{config["runtime"]["python_version"]} -m virtualenv {venv_path}',
-            f"source {venv_path}/bin/activate &&"
-            f"cd {remote_project_path} &&"
-            "python -m pip install --upgrade pip &&"
-            f'python -m pip install -v --requirement {config["runtime"]["requirements_path"]}',
-        ]
-        ssh_conn.run_commands(commands)
+        prep_command = " && ".join(
+            [
+                f"mkdir -p {remote_project_path} {project_path_uuid_prod}",
+                f'python{runtime_config["python_version"]} -m virtualenv {venv_path}',
+                f"source {venv_path}/bin/activate",
+                f"cd {remote_project_path}",
+                "python -m pip install --upgrade pip",
+                f"python -m pip install -v --requirement {requirements_path}",
+            ]
+        )
+        ssh_conn.run_commands([prep_command])
 
         # Start the watcher and then start the API development server
         sync_directory(ssh_conn, os.getcwd(), project_path_uuid_dev)
 
-        project_name = config["project"]["name"]
-        pip_req_path = os.path.join(
-            remote_project_path, config["runtime"]["requirements_path"]
-        )
-        handler_path = os.path.join(
-            remote_project_path, config["runtime"]["handler_path"]
-        )
+        pip_req_path = os.path.join(remote_project_path, requirements_path)
+        handler_path = os.path.join(remote_project_path, runtime_config["handler_path"])
 
         launch_api_server = [
-            f"""
-            pkill inotify
-
-            function force_kill {{
-                kill $1 2>/dev/null
-                sleep 1
-
-                if ps -p $1 > /dev/null; then
-                    echo "Graceful kill failed, attempting SIGKILL..."
-                    kill -9 $1 2>/dev/null
-                    sleep 1
-
-                    if ps -p $1 > /dev/null; then
-                        echo "Failed to kill process with PID: $1"
-                        exit 1
-                    else
-                        echo "Killed process with PID: $1 using SIGKILL"
-                    fi
-
-                else
-                    echo "Killed process with PID: $1"
-                fi
-            }}
-
-            function cleanup {{
-                echo "Cleaning up..."
-                force_kill $last_pid
-            }}
-
-            trap cleanup EXIT SIGINT
-
-            if source {project_path_uuid_dev}/venv/bin/activate; then
-                echo -e "- Activated virtual environment."
-            else
-                echo "Failed to activate virtual environment."
-                exit 1
-            fi
-
-            if cd {project_path_uuid_dev}/{project_name}; then
-                echo -e "- Changed to project directory."
-            else
-                echo "Failed to change directory."
-                exit 1
-            fi
-
-            exclude_pattern='(__pycache__|\\.pyc$)'
-            function update_exclude_pattern {{
-                exclude_pattern='(__pycache__|\\.pyc$)'
-                if [[ -f .runpodignore ]]; then
-                    while IFS= read -r line; do
-                        line=$(echo "$line" | tr -d '[:space:]')
-                        [[ "$line" =~ ^#.*$ || -z "$line" ]] && continue # Skip comments and empty lines
-                        exclude_pattern="${{exclude_pattern}}|(${{line}})"
-                    done < .runpodignore
-                    echo -e "- Ignoring files matching pattern: $exclude_pattern"
-                fi
-            }}
-            update_exclude_pattern
-
-            # Start the API server in the background, and save the PID
-            python {handler_path} --rp_serve_api --rp_api_host="0.0.0.0" --rp_api_port=8080 --rp_api_concurrency=1 &
-            last_pid=$!
-
-            echo -e "- Started API server with PID: $last_pid" && echo ""
-            echo "Connect to the API server at:"
-            echo ">  https://$RUNPOD_POD_ID-8080.proxy.runpod.net" && echo ""
-
-            while true; do
-                if changed_file=$(inotifywait -q -r -e modify,create,delete --exclude "$exclude_pattern" {remote_project_path} --format '%w%f'); then
-                    echo "Detected changes in: $changed_file"
-                else
-                    echo "Failed to detect changes."
-                    exit 1
-                fi
-
-                force_kill $last_pid
-
-                if [[ $changed_file == *"requirements"* ]]; then
-                    echo "Installing new requirements..."
-                    python -m pip install --upgrade pip && python -m pip install -r {pip_req_path}
-                fi
-
-                if [[ $changed_file == *".runpodignore"* ]]; then
-                    update_exclude_pattern
-                fi
-
-                python {handler_path} --rp_serve_api --rp_api_host="0.0.0.0" --rp_api_port=8080 --rp_api_concurrency=1 &
-                last_pid=$!
-
-                echo "Restarted API server with PID: $last_pid"
-            done
-        """
+            _load_launch_api_server_script().format(
+                project_path_uuid_dev=project_path_uuid_dev,
+                project_name=project_name,
+                remote_project_path=remote_project_path,
+                handler_path=handler_path,
+                pip_req_path=pip_req_path,
+            )
         ]
 
         print("")
@@ -353,7 +280,12 @@ def create_project_endpoint():
     - Create a new endpoint using the template
     """
     config = load_project_config()
-    project_pod_id = get_project_pod(config["project"]["uuid"])
+    project_config = config["project"]
+    runtime_config = config["runtime"]
+    project_uuid = project_config["uuid"]
+    project_name = project_config["name"]
+
+    project_pod_id = get_project_pod(project_uuid)
 
     # Check if the project pod already exists, if not create it.
     if not project_pod_id:
@@ -363,60 +295,54 @@ def create_project_endpoint():
         return None
 
     with SSHConnection(project_pod_id) as ssh_conn:
-        project_path_uuid = (
-            f'{config["project"]["volume_mount_path"]}/{config["project"]["uuid"]}'
-        )
+        project_path_uuid = f'{project_config["volume_mount_path"]}/{project_uuid}'
         project_path_uuid_prod = os.path.join(project_path_uuid, "prod")
-        remote_project_path = os.path.join(
-            project_path_uuid_prod, config["project"]["name"]
-        )
+        remote_project_path = os.path.join(project_path_uuid_prod, project_name)
 
         # Copy local files to the pod project folder
         ssh_conn.run_commands([f"mkdir -p {remote_project_path}"])
         print(f"Syncing files to pod {project_pod_id} prod")
         ssh_conn.rsync(os.getcwd(), project_path_uuid_prod)
 
-        # Create the virtual environment
+        # Create the virtual environment and install requirements in a single session
         venv_path = os.path.join(project_path_uuid_prod, "venv")
         print(
             f"Activating Python virtual environment: {venv_path} on pod {project_pod_id}"
         )
-        commands = [
-            f'python{config["runtime"]["python_version"]} -m venv {venv_path}',
-            f"source {venv_path}/bin/activate &&"
-            f"cd {remote_project_path} &&"
-            "python -m pip install --upgrade pip &&"
-            f'python -m pip install -v --requirement {config["runtime"]["requirements_path"]}',
-        ]
-        ssh_conn.run_commands(commands)
+        prep_command = " && ".join(
+            [
+                f'python{runtime_config["python_version"]} -m venv {venv_path}',
+                f"source {venv_path}/bin/activate",
+                f"cd {remote_project_path}",
+                "python -m pip install --upgrade pip",
+                f'python -m pip install -v --requirement {runtime_config["requirements_path"]}',
+            ]
+        )
+        ssh_conn.run_commands([prep_command])
         ssh_conn.close()
 
-    environment_variables = {}
-    for variable in config["project"]["env_vars"]:
-        environment_variables[variable] = config["project"]["env_vars"][variable]
+    environment_variables = dict(project_config["env_vars"])
 
     # Construct the docker start command
-    activate_cmd = (
-        f'. /runpod-volume/{config["project"]["uuid"]}/prod/venv/bin/activate'
-    )
-    python_cmd = f'python -u /runpod-volume/{config["project"]["uuid"]}/prod/{config["project"]["name"]}/{config["runtime"]["handler_path"]}'  # pylint: disable=line-too-long
-    docker_start_cmd = 'bash -c "' + activate_cmd + " && " + python_cmd + '"'
+    prod_path = f"/runpod-volume/{project_uuid}/prod"
+    handler_path = runtime_config["handler_path"]
+    docker_start_cmd = f'bash -c ". {prod_path}/venv/bin/activate && python -u {prod_path}/{project_name}/{handler_path}"'  # pylint: disable=line-too-long
 
     project_endpoint_template = create_template(
-        name=f'{config["project"]["name"]}-endpoint | {config["project"]["uuid"]} | {datetime.now()}',  # pylint: disable=line-too-long
-        image_name=config["project"]["base_image"],
-        container_disk_in_gb=config["project"]["container_disk_size_gb"],
+        name=f"{project_name}-endpoint | {project_uuid} | {datetime.now()}",
+        image_name=project_config["base_image"],
+        container_disk_in_gb=project_config["container_disk_size_gb"],
         docker_start_cmd=docker_start_cmd,
         env=environment_variables,
         is_serverless=True,
     )
 
-    deployed_endpoint = get_project_endpoint(config["project"]["uuid"])
+    deployed_endpoint = get_project_endpoint(project_uuid)
     if not deployed_endpoint:
         deployed_endpoint = create_endpoint(
-            name=f'{config["project"]["name"]}-endpoint | {config["project"]["uuid"]}',
+            name=f"{project_name}-endpoint | {project_uuid}",
             template_id=project_endpoint_template["id"],
-            network_volume_id=config["project"]["storage_id"],
+            network_volume_id=project_config["storage_id"],
         )
     else:
         deployed_endpoint = update_endpoint_template(
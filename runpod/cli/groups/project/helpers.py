@@ -5,12 +5,15 @@ import re
 import shutil
 
 import click
-import tomlkit
+import tomli as toml
 
 from runpod import create_pod
 from runpod import error as rp_error
 from runpod import get_endpoints, get_pods
 
+# Parsed runpod.toml files, keyed by path -> ((mtime_ns, size), config)
+_PROJECT_CONFIG_CACHE = {}
+
 
 def validate_project_name(name):
     """
@@ -57,21 +60,41 @@ def copy_template_files(template_dir, destination):
             shutil.copy2(source_item, destination_item)
 
 
-def attempt_pod_launch(config, environment_variables):
-    """Attempt to launch a pod with the given configuration."""
-    for gpu_type in config["project"].get("gpu_types", []):
+def replace_placeholders(file_path, substitutions):
+    """Replace every placeholder key in the file with its value in a single pass."""
+    pattern = re.compile("|".join(map(re.escape, substitutions)))
+
+    with open(file_path, "r", encoding="utf-8") as file:
+        content = file.read()
+
+    content = pattern.sub(lambda match: substitutions[match.group(0)], content)
+
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(content)
+
+
+def attempt_pod_launch(config, environment_variables, gpu_types=None):
+    """Attempt to launch a pod with the given configuration.
+
+    Tries each of gpu_types in order, defaulting to the project's gpu_types.
+    """
+    project_config = config["project"]
+    if gpu_types is None:
+        gpu_types = project_config.get("gpu_types", [])
+
+    for gpu_type in gpu_types:
         print(f"Trying to get a pod with {gpu_type}... ", end="")
         try:
             created_pod = create_pod(
-                f'{config["project"]["name"]}-dev ({config["project"]["uuid"]})',
-                config["project"]["base_image"],
+                f'{project_config["name"]}-dev ({project_config["uuid"]})',
+                project_config["base_image"],
                 gpu_type,
-                gpu_count=int(config["project"]["gpu_count"]),
+                gpu_count=int(project_config["gpu_count"]),
                 support_public_ip=True,
-                ports=f'{config["project"]["ports"]}',
-                network_volume_id=f'{config["project"]["storage_id"]}',
-                volume_mount_path=f'{config["project"]["volume_mount_path"]}',
-                container_disk_in_gb=int(config["project"]["container_disk_size_gb"]),
+                ports=f'{project_config["ports"]}',
+                network_volume_id=f'{project_config["storage_id"]}',
+                volume_mount_path=f'{project_config["volume_mount_path"]}',
+                container_disk_in_gb=int(project_config["container_disk_size_gb"]),
                 env=environment_variables,
             )
             print("Success!")
@@ -82,9 +105,25 @@ def attempt_pod_launch(config, environment_variables):
 
 
 def load_project_config():
-    """Load the project config file."""
+    """Load the project config file.
+
+    The parsed config is cached per path and only re-read when the file's
+    modification time or size changes. The returned config is shared between
+    callers and must be treated as read-only; copy values before mutating them.
+    """
     project_config_file = os.path.join(os.getcwd(), "runpod.toml")
     if not os.path.exists(project_config_file):
         raise FileNotFoundError("runpod.toml not found in the current directory.")
-    with open(project_config_file, "r", encoding="UTF-8") as config_file:
-        return tomlkit.load(config_file)
+
+    config_stat = os.stat(project_config_file)
+    cache_key = (config_stat.st_mtime_ns, config_stat.st_size)
+
+    cached = _PROJECT_CONFIG_CACHE.get(project_config_file)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    with open(project_config_file, "rb") as config_file:
+        config = toml.load(config_file)
+
+    _PROJECT_CONFIG_CACHE[project_config_file] = (cache_key, config)
+    return config
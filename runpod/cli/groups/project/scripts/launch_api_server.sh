@@ -0,0 +1,109 @@
+#!/bin/bash
+# Started over SSH by `runpod project start`; placeholders are filled with str.format.
+
+pkill inotify
+
+function force_kill {{
+    kill $1 2>/dev/null
+    sleep 1
+
+    if ps -p $1 > /dev/null; then
+        echo "Graceful kill failed, attempting SIGKILL..."
+        kill -9 $1 2>/dev/null
+        sleep 1
+
+        if ps -p $1 > /dev/null; then
+            echo "Failed to kill process with PID: $1"
+            exit 1
+        else
+            echo "Killed process with PID: $1 using SIGKILL"
+        fi
+
+    else
+        echo "Killed process with PID: $1"
+    fi
+}}
+
+function cleanup {{
+    echo "Cleaning up..."
+    force_kill $last_pid
+}}
+
+trap cleanup EXIT SIGINT
+
+if source {project_path_uuid_dev}/venv/bin/activate; then
+    echo -e "- Activated virtual environment."
+else
+    echo "Failed to activate virtual environment."
+    exit 1
+fi
+
+if cd {project_path_uuid_dev}/{project_name}; then
+    echo -e "- Changed to project directory."
+else
+    echo "Failed to change directory."
+    exit 1
+fi
+
+function update_exclude_pattern {{
+    exclude_pattern='(__pycache__|\.pyc$)'
+    if [[ -f .runpodignore ]]; then
+        # Skip comments and empty lines, then join the remaining lines into one alternation
+        ignore_pattern=$(grep -Ev '^[[:space:]]*(#|$)' .runpodignore | tr -d '[:blank:]\r' | sed 's/.*/(&)/' | paste -sd'|' -)
+        [[ -n "$ignore_pattern" ]] && exclude_pattern="${{exclude_pattern}}|${{ignore_pattern}}"
+        echo -e "- Ignoring files matching pattern: $exclude_pattern"
+    fi
+}}
+update_exclude_pattern
+
+# Hash requirements without comments or blank lines, edits to those don't need a reinstall
+function hash_requirements {{
+    grep -Ev '^[[:space:]]*(#|$)' {pip_req_path} 2>/dev/null | sha256sum | cut -d' ' -f1
+}}
+requirements_hash=$(hash_requirements)
+
+# Start the API server in the background, and save the PID
+python {handler_path} --rp_serve_api --rp_api_host="0.0.0.0" --rp_api_port=8080 --rp_api_concurrency=1 &
+last_pid=$!
+
+echo -e "- Started API server with PID: $last_pid" && echo ""
+echo "Connect to the API server at:"
+echo ">  https://$RUNPOD_POD_ID-8080.proxy.runpod.net" && echo ""
+
+while true; do
+    if changed_file=$(inotifywait -q -r -e modify,create,delete --exclude "$exclude_pattern" {remote_project_path} --format '%w%f'); then
+        echo "Detected changes in: $changed_file"
+    else
+        echo "Failed to detect changes."
+        exit 1
+    fi
+
+    # Collect follow-up events until the project is quiet for a second, so a burst restarts once.
+    # Stop collecting after 5 seconds so a file that never stops changing can't block the restart.
+    drain_deadline=$((SECONDS + 5))
+    while (( SECONDS < drain_deadline )) && next_file=$(inotifywait -q -r -t 1 -e modify,create,delete --exclude "$exclude_pattern" {remote_project_path} --format '%w%f'); do
+        echo "Detected changes in: $next_file"
+        changed_file="${{changed_file}} ${{next_file}}"
+    done
+
+    force_kill $last_pid
+
+    if [[ $changed_file == *"requirements"* ]]; then
+        new_requirements_hash=$(hash_requirements)
+        if [[ "$new_requirements_hash" != "$requirements_hash" ]]; then
+            echo "Installing new requirements..."
+            python -m pip install --upgrade pip && python -m pip install -r {pip_req_path} && requirements_hash=$new_requirements_hash
+        else
+            echo "Requirements unchanged, skipping install."
+        fi
+    fi
+
+    if [[ $changed_file == *".runpodignore"* ]]; then
+        update_exclude_pattern
+    fi
+
+    python {handler_path} --rp_serve_api --rp_api_host="0.0.0.0" --rp_api_port=8080 --rp_api_concurrency=1 &
+    last_pid=$!
+
+    echo "Restarted API server with PID: $last_pid"
+done
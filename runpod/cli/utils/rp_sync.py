@@ -60,7 +60,7 @@ def sync_directory(ssh_client, local_path, remote_path):
 
     def sync():
         print("Syncing files...")
-        ssh_client.rsync(local_path, remote_path, quiet=True)
+        ssh_client.rsync(local_path, remote_path, quiet=True, whole_file=True)
 
     threading.Thread(target=start_watcher, daemon=True, args=(sync, local_path)).start()
 
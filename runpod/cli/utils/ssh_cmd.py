@@ -4,6 +4,7 @@ RunPod | CLI | Utils | SSH Command
 Connect and run commands over SSH.
 """
 
+import os
 import signal
 import subprocess
 import sys
@@ -20,6 +21,10 @@ from .rp_userspace import find_ssh_key_file
 
 colorama.init(autoreset=True)  # Initialize colorama
 
+# OpenSSH control sockets, lets back-to-back ssh/rsync calls reuse one connection
+SSH_CONTROL_DIR = os.path.expanduser("~/.runpod/cp")
+SSH_CONTROL_PERSIST_SECONDS = 600
+
 
 class SSHConnection:
     """Connect and run commands over SSH."""
@@ -43,6 +48,9 @@ class SSHConnection:
             print(colorama.Fore.RED + f"[{pod_id}]", err)
             sys.exit(1)
 
+        if sys.platform != "win32":
+            os.makedirs(SSH_CONTROL_DIR, mode=0o700, exist_ok=True)
+
         signal.signal(signal.SIGINT, self._signal_handler)
 
     def __enter__(self):
@@ -53,8 +61,12 @@ class SSHConnection:
         self.close()
 
     def _get_ssh_options(self):
-        """Get the SSH options for connecting to the pod."""
-        return [
+        """Get the SSH options for connecting to the pod.
+
+        Outside of Windows, connections are multiplexed over a persistent master
+        so later ssh/rsync calls to the same pod skip the handshake.
+        """
+        ssh_options = [
             "-o",
             "StrictHostKeyChecking=no",
             "-o",
@@ -65,6 +77,20 @@ class SSHConnection:
             self.key_file,
         ]
 
+        if sys.platform != "win32":
+            ssh_options.extend(
+                [
+                    "-o",
+                    "ControlMaster=auto",
+                    "-o",
+                    f"ControlPath={os.path.join(SSH_CONTROL_DIR, '%C')}",
+                    "-o",
+                    f"ControlPersist={SSH_CONTROL_PERSIST_SECONDS}",
+                ]
+            )
+
+        return ssh_options
+
     def _signal_handler(self, signum, frame):
         """Handle signals."""
         del signum, frame
@@ -125,7 +151,7 @@ class SSHConnection:
 
         subprocess.run(cmd, check=True)
 
-    def rsync(self, local_path, remote_path, quiet=False):
+    def rsync(self, local_path, remote_path, quiet=False, whole_file=False):
         """Sync a local directory to a remote directory over SSH.
 
         A .runpodignore file can be used to ignore files and directories.
@@ -134,8 +160,17 @@ class SSHConnection:
         Args:
             local_path (str): The local directory to sync.
             remote_path (str): The remote directory to sync.
+            quiet (bool): Suppress rsync's output.
+            whole_file (bool): Skip the delta algorithm and write files in place.
+                Compression is skipped when RUNPOD_LOCAL_POD=1.
         """
-        rsync_cmd = ["rsync", "-avz", "--no-owner", "--no-group"]
+        if whole_file:
+            rsync_cmd = ["rsync", "-aW", "--inplace"]
+            if os.environ.get("RUNPOD_LOCAL_POD") != "1":
+                rsync_cmd.append("-z")
+        else:
+            rsync_cmd = ["rsync", "-avz"]
+        rsync_cmd.extend(["--no-owner", "--no-group"])
 
         for pattern in get_ignore_list():
             rsync_cmd.extend(["--exclude", pattern])
@@ -154,6 +189,46 @@ class SSHConnection:
 
         return subprocess.run(rsync_cmd, check=True)
 
+    def bulk_upload(self, local_path, remote_path):
+        """Upload a local directory to a remote directory as a single tar stream.
+
+        Intended for the initial push to a fresh remote directory, where rsync's
+        delta scan has nothing to compare against. Like rsync, the local directory
+        is created inside the remote directory and .runpodignore is honored, and
+        like rsync's --no-owner/--no-group, extracted files are owned by root.
+
+        Args:
+            local_path (str): The local directory to upload.
+            remote_path (str): The remote directory to upload into.
+        """
+        local_path = os.path.abspath(local_path)
+
+        tar_cmd = ["tar", "-C", os.path.dirname(local_path), "-cf", "-"]
+        for pattern in get_ignore_list():
+            tar_cmd.append(f"--exclude={pattern.strip('/')}")
+        tar_cmd.append(os.path.basename(local_path))
+
+        ssh_cmd = (
+            ["ssh"]
+            + self._get_ssh_options()
+            + [
+                f"root@{self.pod_ip}",
+                f"mkdir -p {remote_path} && tar --no-same-owner -C {remote_path} -xf -",
+            ]
+        )
+
+        # Keep macOS bsdtar from adding AppleDouble ._* files for extended attributes
+        tar_env = {**os.environ, "COPYFILE_DISABLE": "1"}
+
+        with subprocess.Popen(tar_cmd, stdout=subprocess.PIPE, env=tar_env) as tar_proc:
+            result = subprocess.run(ssh_cmd, stdin=tar_proc.stdout, check=True)
+            tar_proc.stdout.close()
+
+        if tar_proc.returncode != 0:
+            raise subprocess.CalledProcessError(tar_proc.returncode, tar_cmd)
+
+        return result
+
     def close(self):
         """Close the SSH connection."""
         self.ssh.close()
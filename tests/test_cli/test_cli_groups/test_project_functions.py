@@ -22,26 +22,25 @@ class TestCreateNewProject(unittest.TestCase):
             shutil.rmtree(toml_file_location)
 
     @patch("os.makedirs")
-    @patch("os.path.exists", return_value=False)
     @patch("os.getcwd", return_value="/current/path")
     @patch("runpod.cli.groups.project.functions.copy_template_files")
     def test_create_project_folder(
-        self, mock_copy_template_files, mock_getcwd, mock_exists, mock_makedirs
+        self, mock_copy_template_files, mock_getcwd, mock_makedirs
     ):  # pylint: disable=line-too-long
         """Test that a new project folder is created if init_current_dir is False."""
         with patch("builtins.open", new_callable=mock_open):
             create_new_project("test_project", "volume_id", "11.1.1", "3.8")
-        mock_makedirs.assert_called_once_with("/current/path/test_project")
+        mock_makedirs.assert_called_once_with(
+            "/current/path/test_project", exist_ok=True
+        )
         assert mock_copy_template_files.called
         assert mock_getcwd.called
-        assert mock_exists.called
 
     @patch("os.makedirs")
-    @patch("os.path.exists", return_value=False)
     @patch("os.getcwd", return_value="/tmp/testdir")
     @patch("builtins.open", new_callable=mock_open)
     def test_create_new_project_init_current_dir(
-        self, mock_file_open, mock_getcwd, mock_path_exists, mock_makedirs
+        self, mock_file_open, mock_getcwd, mock_makedirs
     ):  # pylint: disable=line-too-long
         """Test that a new project folder is not created if init_current_dir is True."""
         project_name = "test_project"
@@ -61,14 +60,12 @@ class TestCreateNewProject(unittest.TestCase):
             "/tmp/testdir/runpod.toml", "w", encoding="UTF-8"
         )
         assert mock_getcwd.called
-        assert mock_path_exists.called is False
 
     @patch("os.makedirs")
-    @patch("os.path.exists", return_value=False)
     @patch("os.getcwd", return_value="/current/path")
     @patch("runpod.cli.groups.project.functions.copy_template_files")
     def test_copy_template_files(
-        self, mock_copy_template_files, mock_getcwd, mock_exists, mock_makedirs
+        self, mock_copy_template_files, mock_getcwd, mock_makedirs
     ):  # pylint: disable=line-too-long
         """Test that template files are copied to the new project folder."""
         with patch("builtins.open", new_callable=mock_open):
@@ -77,17 +74,16 @@ class TestCreateNewProject(unittest.TestCase):
             STARTER_TEMPLATES + "/default", "/current/path/test_project"
         )  # pylint: disable=line-too-long
         assert mock_getcwd.called
-        assert mock_exists.called
         assert mock_makedirs.called
 
-    @patch("os.path.exists", return_value=True)
+    @patch("os.makedirs")
     @patch(
         "builtins.open",
         new_callable=mock_open,
         read_data="data with <<MODEL_NAME>> placeholder",
     )  # pylint: disable=line-too-long
     def test_replace_placeholders_in_handler(
-        self, mock_open_file, mock_exists
+        self, mock_open_file, mock_makedirs
     ):  # pylint: disable=line-too-long
         """Test that placeholders in handler.py are replaced if model_name is given."""
         with patch("runpod.cli.groups.project.functions.copy_template_files"):
@@ -95,11 +91,11 @@ class TestCreateNewProject(unittest.TestCase):
                 "test_project", "volume_id", "11.8.0", "3.8", model_name="my_model"
             )
         assert mock_open_file.called
-        assert mock_exists.called
+        assert mock_makedirs.called
 
-    @patch("os.path.exists", return_value=False)
+    @patch("os.makedirs")
     @patch("builtins.open", new_callable=mock_open)
-    def test_create_runpod_toml(self, mock_open_file, mock_exists):
+    def test_create_runpod_toml(self, mock_open_file, mock_makedirs):
         """Test that runpod.toml configuration file is created."""
         with patch("runpod.cli.groups.project.functions.copy_template_files"):
             create_new_project("test_project", "volume_id", "11.8.0", "3.8")
@@ -107,29 +103,29 @@ class TestCreateNewProject(unittest.TestCase):
         mock_open_file.assert_called_with(
             toml_file_location, "w", encoding="UTF-8"
         )  # pylint: disable=line-too-long
-        assert mock_exists.called
+        assert mock_makedirs.called
 
-    @patch("os.path.exists", return_value=True)
+    @patch("os.makedirs")
     @patch("builtins.open", new_callable=mock_open, read_data="<<RUNPOD>> placeholder")
-    def test_update_requirements_file(self, mock_open_file, mock_exists):
+    def test_update_requirements_file(self, mock_open_file, mock_makedirs):
         """Test that placeholders in requirements.txt are replaced correctly."""
         with patch("runpod.cli.groups.project.functions.__version__", "dev"), patch(
             "runpod.cli.groups.project.functions.copy_template_files"
         ):
             create_new_project("test_project", "volume_id", "11.8.0", "3.8")
         assert mock_open_file.called
-        assert mock_exists.called
+        assert mock_makedirs.called
 
-    @patch("os.path.exists", return_value=True)
+    @patch("os.makedirs")
     @patch("builtins.open", new_callable=mock_open, read_data="<<RUNPOD>> placeholder")
-    def test_update_requirements_file_non_dev(self, mock_open_file, mock_exists):
+    def test_update_requirements_file_non_dev(self, mock_open_file, mock_makedirs):
         """Test that placeholders in requirements.txt are replaced for non-dev versions."""
         with patch("runpod.cli.groups.project.functions.__version__", "1.0.0"), patch(
             "runpod.cli.groups.project.functions.copy_template_files"
         ):
             create_new_project("test_project", "volume_id", "11.8.0", "3.8")
         assert mock_open_file.called
-        assert mock_exists.called
+        assert mock_makedirs.called
 
 
 class TestStartProject(unittest.TestCase):
@@ -141,8 +137,10 @@ class TestStartProject(unittest.TestCase):
     @patch("runpod.cli.groups.project.functions.get_pod")
     @patch("runpod.cli.groups.project.functions.SSHConnection")
     @patch("os.getcwd", return_value="/current/path")
+    @patch("runpod.cli.groups.project.functions.time.sleep")
     def test_start_nonexistent_successfully(
         self,
+        mock_sleep,
         mock_getcwd,
         mock_ssh_connection,
         mock_get_pod,
@@ -186,13 +184,42 @@ class TestStartProject(unittest.TestCase):
 
         with patch(
             "runpod.cli.groups.project.functions.sync_directory"
-        ) as mock_sync_directory:
+        ) as mock_sync_directory, patch("builtins.print") as mock_print:
             start_project()
 
-        mock_attempt_pod_launch.assert_called()
+        mock_print.assert_any_call(
+            "    - uuid: 123456\n"
+            "    - name: test_project\n"
+            "    - volume_mount_path: /mount/path\n"
+            "    - env_vars: {'ENV_VAR': 'value'}\n"
+            "    - gpu: NVIDIA GPU",
+            end="\n\n",
+        )
+
+        mock_attempt_pod_launch.assert_called_with(
+            mock_load_project_config.return_value,
+            {"RUNPOD_PROJECT_ID": "123456", "ENV_VAR": "value"},
+            ["NVIDIA GPU"],
+        )
+        assert "gpu_types" not in mock_load_project_config.return_value["project"]
         mock_get_pod.assert_called_with("new_pod_id")
+        mock_sleep.assert_called_once_with(0.5)
         mock_ssh_connection.assert_called_with("new_pod_id")
         mock_ssh_instance.run_commands.assert_called()
+        mock_ssh_instance.bulk_upload.assert_called_once_with(
+            "/current/path", "/mount/path/123456/dev"
+        )
+        mock_ssh_instance.rsync.assert_not_called()
+        mock_ssh_instance.run_commands.assert_any_call(
+            [
+                "mkdir -p /mount/path/123456/dev/test_project /mount/path/123456/prod"
+                " && python3.8 -m virtualenv /mount/path/123456/dev/venv"
+                " && source /mount/path/123456/dev/venv/bin/activate"
+                " && cd /mount/path/123456/dev/test_project"
+                " && python -m pip install --upgrade pip"
+                " && python -m pip install -v --requirement requirements.txt"
+            ]
+        )
         assert mock_getcwd.called
         assert mock_sync_directory.called
 
@@ -212,6 +239,43 @@ class TestStartProject(unittest.TestCase):
                 "Selected GPU types unavailable, try again later or use a different type."
             )  # pylint: disable=line-too-long
 
+    @patch("runpod.cli.groups.project.functions.load_project_config")
+    @patch("runpod.cli.groups.project.functions.get_project_pod")
+    @patch("runpod.cli.groups.project.functions.attempt_pod_launch")
+    @patch("runpod.cli.groups.project.functions.get_pod")
+    @patch("runpod.cli.groups.project.functions.time")
+    def test_pod_launch_timeout(
+        self,
+        mock_time,
+        mock_get_pod,
+        mock_attempt_pod_launch,
+        mock_get_project_pod,
+        mock_load_project_config,
+    ):  # pylint: disable=too-many-arguments
+        """Test that waiting for the pod backs off and gives up after the timeout."""
+        mock_load_project_config.return_value = {
+            "project": {"uuid": "123456", "name": "test_project"},
+            "runtime": {"handler_path": "handler.py", "requirements_path": "req.txt"},
+        }
+        mock_get_project_pod.return_value = None
+        mock_attempt_pod_launch.return_value = {"id": "new_pod_id", "runtime": None}
+        mock_get_pod.return_value = {"id": "new_pod_id", "runtime": None}
+        mock_time.monotonic.side_effect = [0, 1, 2, 3, 601]
+
+        with patch("builtins.print") as mock_print, patch(
+            "runpod.cli.groups.project.functions.SSHConnection"
+        ) as mock_ssh_connection:
+            self.assertIsNone(start_project())
+
+        mock_print.assert_called_with(
+            "Pod new_pod_id did not come online within 600 seconds. "
+            "It may still be running, stop it from the RunPod console."
+        )
+        mock_ssh_connection.assert_not_called()
+
+        delays = [call.args[0] for call in mock_time.sleep.call_args_list]
+        self.assertEqual(delays, [0.5, 0.75, 1.125])
+
 
 class TestStartProjectAPI(unittest.TestCase):
     """Test the start_project_api function."""
@@ -256,7 +320,16 @@ class TestStartProjectAPI(unittest.TestCase):
         mock_sync_directory.assert_called_with(
             mock_ssh_instance, "/current/path", "/mount/path/123456/dev"
         )
+        mock_ssh_instance.rsync.assert_called_once_with(
+            "/current/path", "/mount/path/123456/dev"
+        )
+        mock_ssh_instance.bulk_upload.assert_not_called()
         mock_ssh_instance.run_commands.assert_called()
+
+        launch_script = mock_ssh_instance.run_commands.call_args[0][0][0]
+        assert "source /mount/path/123456/dev/venv/bin/activate" in launch_script
+        assert "python /mount/path/123456/dev/test_project/handler.py" in launch_script
+        assert "function force_kill {" in launch_script
         assert mock_getcwd.called
 
 
@@ -1,9 +1,12 @@
 """Tests for the project helpers."""
 
+import os
+import tempfile
 import unittest
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import click
+import tomli as toml
 
 from runpod import error as rp_error
 from runpod.cli.groups.project.helpers import (
@@ -12,6 +15,7 @@ from runpod.cli.groups.project.helpers import (
     get_project_endpoint,
     get_project_pod,
     load_project_config,
+    replace_placeholders,
     validate_project_name,
 )
 
@@ -75,6 +79,20 @@ class TestHelpers(unittest.TestCase):
         self.assertEqual(mock_copy.call_count, 2)
         assert mock_isdir.called
 
+    def test_replace_placeholders(self):
+        """Test the replace_placeholders function."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "requirements.txt")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write("<<RUNPOD>>\n<<MODEL_NAME>> <<RUNPOD>>\n")
+
+            replace_placeholders(
+                file_path, {"<<RUNPOD>>": "runpod", "<<MODEL_NAME>>": "my_model"}
+            )
+
+            with open(file_path, "r", encoding="utf-8") as file:
+                self.assertEqual(file.read(), "runpod\nmy_model runpod\n")
+
     @patch("runpod.cli.groups.project.helpers.create_pod")
     def test_attempt_pod_launch_success(self, mock_create_pod):
         """Test the attempt_pod_launch function when it succeeds."""
@@ -96,19 +114,49 @@ class TestHelpers(unittest.TestCase):
         result = attempt_pod_launch(config, environment_variables)
         self.assertEqual(result, "pod_id")
 
+        result = attempt_pod_launch(config, environment_variables, ["other_gpu"])
+        self.assertEqual(result, "pod_id")
+        self.assertEqual(mock_create_pod.call_args[0][2], "other_gpu")
+
         mock_create_pod.side_effect = rp_error.QueryError("error")
         assert attempt_pod_launch(config, environment_variables) is None
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data="[project]\nname='test'")
-    def test_load_project_config(self, mock_file, mock_exists):
+    def test_load_project_config(self):
         """Test the load_project_config function."""
-        config = load_project_config()
-        self.assertEqual(config["project"]["name"], "test")
-        assert mock_exists.called
-        assert mock_file.called
+        with tempfile.TemporaryDirectory() as temp_dir, patch(
+            "os.getcwd", return_value=temp_dir
+        ):
+            config_path = os.path.join(temp_dir, "runpod.toml")
+            with open(config_path, "w", encoding="UTF-8") as config_file:
+                config_file.write("[project]\nname='test'")
+
+            config = load_project_config()
+            self.assertEqual(config["project"]["name"], "test")
 
         with patch("os.path.exists", return_value=False), self.assertRaises(
             FileNotFoundError
         ):
             load_project_config()
+
+    def test_load_project_config_cached(self):
+        """Test that load_project_config only re-parses when the file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir, patch(
+            "os.getcwd", return_value=temp_dir
+        ):
+            config_path = os.path.join(temp_dir, "runpod.toml")
+            with open(config_path, "w", encoding="UTF-8") as config_file:
+                config_file.write("[project]\nname='test'")
+
+            with patch(
+                "runpod.cli.groups.project.helpers.toml.load", wraps=toml.load
+            ) as mock_load:
+                first = load_project_config()
+                second = load_project_config()
+                self.assertIs(first, second)
+                self.assertEqual(mock_load.call_count, 1)
+
+                with open(config_path, "w", encoding="UTF-8") as config_file:
+                    config_file.write("[project]\nname='changed'")
+
+                self.assertEqual(load_project_config()["project"]["name"], "changed")
+                self.assertEqual(mock_load.call_count, 2)
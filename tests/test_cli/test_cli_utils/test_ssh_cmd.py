@@ -2,12 +2,13 @@
 RunPod | CLI | Utils | SSH Command
 """
 
+import subprocess
 import unittest
 from unittest.mock import MagicMock, patch
 
 import paramiko
 
-from runpod.cli.utils.ssh_cmd import SSHConnection
+from runpod.cli.utils.ssh_cmd import SSH_CONTROL_DIR, SSHConnection
 
 
 class TestSSHConnection(unittest.TestCase):
@@ -30,9 +31,13 @@ class TestSSHConnection(unittest.TestCase):
             return_value=self.mock_ssh_client,
         ).start()
 
+        patch_makedirs = patch("runpod.cli.utils.ssh_cmd.os.makedirs")
+        self.mock_makedirs = patch_makedirs.start()
+
         self.addCleanup(self.patch_get_pod_ssh_ip_port.stop)
         self.addCleanup(self.patch_find_ssh_key_file.stop)
         self.addCleanup(patch_paramiko.stop)
+        self.addCleanup(patch_makedirs.stop)
 
         self.ssh_connection = SSHConnection("pod_id_mock")
 
@@ -88,6 +93,31 @@ class TestSSHConnection(unittest.TestCase):
 
         mock_sftp.get.assert_called_once_with(remote_path, local_path)
 
+    def test_init_creates_control_dir(self):
+        """Test that the ssh control socket directory is created on connect."""
+        self.mock_makedirs.assert_called_once_with(
+            SSH_CONTROL_DIR, mode=0o700, exist_ok=True
+        )
+
+        self.mock_makedirs.reset_mock()
+        with patch("sys.platform", "win32"):
+            SSHConnection("pod_id_mock")
+        self.mock_makedirs.assert_not_called()
+
+    def test_get_ssh_options(self):
+        """Test that ssh connections are multiplexed outside of Windows."""
+        self.mock_makedirs.reset_mock()
+        conn = self.ssh_connection
+        with patch("sys.platform", "linux"):
+            ssh_options = conn._get_ssh_options()  # pylint: disable=protected-access
+        self.assertIn("ControlMaster=auto", ssh_options)
+        self.assertIn("ControlPersist=600", ssh_options)
+        self.mock_makedirs.assert_not_called()
+
+        with patch("sys.platform", "win32"):
+            ssh_options = conn._get_ssh_options()  # pylint: disable=protected-access
+        self.assertNotIn("ControlMaster=auto", ssh_options)
+
     @patch("subprocess.run")
     def test_launch_terminal(self, mock_subprocess):
         """Test that launch_terminal() calls subprocess.run()."""
@@ -100,6 +130,50 @@ class TestSSHConnection(unittest.TestCase):
         self.ssh_connection.rsync("local_path", "remote_path", quiet=True)
         mock_subprocess.assert_called_once()
 
+    @patch("subprocess.run")
+    def test_rsync_whole_file(self, mock_subprocess):
+        """Test that rsync() uses whole-file, in-place transfers when requested."""
+        with patch.dict("os.environ", {}, clear=True):
+            self.ssh_connection.rsync(
+                "local_path", "remote_path", quiet=True, whole_file=True
+            )
+        rsync_cmd = mock_subprocess.call_args[0][0]
+        self.assertEqual(rsync_cmd[:3], ["rsync", "-aW", "--inplace"])
+        self.assertIn("-z", rsync_cmd)
+        self.assertIn("--quiet", rsync_cmd)
+
+        with patch.dict("os.environ", {"RUNPOD_LOCAL_POD": "1"}):
+            self.ssh_connection.rsync("local_path", "remote_path", whole_file=True)
+        self.assertNotIn("-z", mock_subprocess.call_args[0][0])
+
+    @patch("subprocess.run")
+    @patch("subprocess.Popen")
+    def test_bulk_upload(self, mock_popen, mock_subprocess):
+        """Test that bulk_upload() pipes a tar stream into a single ssh call."""
+        mock_tar = mock_popen.return_value.__enter__.return_value
+        mock_tar.returncode = 0
+
+        self.ssh_connection.bulk_upload("/local/project", "/remote/path")
+
+        tar_cmd = mock_popen.call_args[0][0]
+        self.assertEqual(tar_cmd[:3], ["tar", "-C", "/local"])
+        self.assertEqual(tar_cmd[-1], "project")
+        self.assertIn("--exclude=__pycache__", tar_cmd)
+
+        ssh_cmd = mock_subprocess.call_args[0][0]
+        self.assertEqual(ssh_cmd[0], "ssh")
+        self.assertEqual(
+            ssh_cmd[-1],
+            "mkdir -p /remote/path && tar --no-same-owner -C /remote/path -xf -",
+        )
+        self.assertIn("--no-same-owner", ssh_cmd[-1].split())
+        self.assertEqual(mock_subprocess.call_args[1]["stdin"], mock_tar.stdout)
+        self.assertEqual(mock_popen.call_args[1]["env"]["COPYFILE_DISABLE"], "1")
+
+        mock_tar.returncode = 2
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.ssh_connection.bulk_upload("/local/project", "/remote/path")
+
     # Test that the signal handler closes the connection.
     @patch("runpod.cli.utils.ssh_cmd.SSHConnection.close")
     def test_signal_handler(self, mock_close):
@@ -86,7 +86,7 @@ class TestSyncDirectory(unittest.TestCase):
         sync_function()
 
         mock_ssh_client.rsync.assert_called_once_with(
-            local_path, remote_path, quiet=True
+            local_path, remote_path, quiet=True, whole_file=True
         )
 
         mock_thread_class.assert_called_once()